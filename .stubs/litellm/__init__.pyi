@@ -1,6 +1,9 @@
-from typing import Any, Literal, NotRequired, TypedDict
+from collections.abc import AsyncIterator
+from typing import Any, Literal, NotRequired, TypedDict, overload
 
 modify_params: bool
+request_timeout: float
+success_callback: list[Any]
 
 _MessageRole = Literal["system", "user", "assistant", "tool"]
 
@@ -72,7 +75,7 @@ class _LiteLLMModelResponseChoiceToolCall:
 
 class _LiteLLMModelResponseChoiceMessage:
     role: Literal["assistant"]
-    content: str
+    content: str | None
     tool_calls: list[_LiteLLMModelResponseChoiceToolCall] | None
 
 class _LiteLLMModelResponseChoice:
@@ -97,6 +100,33 @@ class ModelResponse:
     usage: _LiteLLMUsage
 
 
+class _LiteLLMStreamOptions(TypedDict):
+    include_usage: bool
+
+
+class _LiteLLMModelResponseStreamDelta:
+    content: str | None
+
+
+class _LiteLLMModelResponseStreamChoice:
+    index: int
+    delta: _LiteLLMModelResponseStreamDelta
+    finish_reason: str | None
+
+
+class ModelResponseStream:
+    id: str
+    created: int
+    model: str
+    object: Literal["chat.completion.chunk"]
+    choices: list[_LiteLLMModelResponseStreamChoice]
+    usage: _LiteLLMUsage | None
+
+
+class CustomStreamWrapper:
+    def __aiter__(self) -> AsyncIterator[ModelResponseStream]: ...
+
+
 class _LiteLLMEmbeddingData(TypedDict):
     index: int
     object: Literal["embedding"]
@@ -157,6 +187,7 @@ class Router:
 
     def __init__(self, *, model_list: list[_LiteLLMRouterModel], fallbacks: list[dict[str, list[str]]]) -> None: ...
 
+    @overload
     async def acompletion(
         self,
         *,
@@ -168,7 +199,25 @@ class Router:
         max_tokens: int | None = None,
         temperature: float = 1.0,
         num_retries: int = 0,
+        stream: Literal[False] = False,
+        client: Any = None,
     ) -> ModelResponse: ...
+    @overload
+    async def acompletion(
+        self,
+        *,
+        model: str,
+        messages: list[_LiteLLMMessage],
+        response_format: Any = None,
+        tools: list[_LiteLLMTool] | None = None,
+        tool_choice: Literal["auto", "required"] | None = None,
+        max_tokens: int | None = None,
+        temperature: float = 1.0,
+        num_retries: int = 0,
+        stream: Literal[True],
+        stream_options: _LiteLLMStreamOptions | None = None,
+        client: Any = None,
+    ) -> CustomStreamWrapper: ...
 
     def completion(
         self,
@@ -181,4 +230,5 @@ class Router:
         max_tokens: int | None = None,
         temperature: float = 1.0,
         num_retries: int = 0,
+        client: Any = None,
     ) -> ModelResponse: ...
\ No newline at end of file
@@ -0,0 +1,21 @@
+import httpx
+
+class AsyncHTTPHandler:
+    timeout: float | httpx.Timeout | None
+
+    def __init__(
+        self,
+        timeout: float | httpx.Timeout | None = None,
+        concurrent_limit: int = 1000,
+        client_alias: str | None = None,
+    ) -> None: ...
+    async def close(self) -> None: ...
+
+class HTTPHandler:
+    def __init__(
+        self,
+        timeout: float | httpx.Timeout | None = None,
+        concurrent_limit: int = 1000,
+        client: httpx.Client | None = None,
+    ) -> None: ...
+    def close(self) -> None: ...
@@ -1,7 +1,14 @@
+from aikernel._internal.cache import LLMResponseCache, LRUResponseCache
 from aikernel._internal.conversation import Conversation
-from aikernel._internal.router import LLMModelName, LLMRouter, get_router
-from aikernel._internal.structured import llm_structured, llm_structured_sync
-from aikernel._internal.tools import llm_tool_call, llm_tool_call_sync
+from aikernel._internal.router import LLMModelName, LLMRouter, get_router, get_routers
+from aikernel._internal.structured import (
+    llm_structured,
+    llm_structured_batch,
+    llm_structured_batch_sync,
+    llm_structured_stream,
+    llm_structured_sync,
+)
+from aikernel._internal.tools import llm_tool_call, llm_tool_call_batch, llm_tool_call_batch_sync, llm_tool_call_sync
 from aikernel._internal.types.provider import (
     LiteLLMCacheControl,
     LiteLLMMediaMessagePart,
@@ -29,17 +36,26 @@ from aikernel._internal.types.response import (
     LLMStructuredResponse,
     LLMUnstructuredResponse,
 )
-from aikernel._internal.unstructured import llm_unstructured, llm_unstructured_sync
+from aikernel._internal.unstructured import llm_unstructured, llm_unstructured_stream, llm_unstructured_sync
 
 __all__ = [
     "llm_structured_sync",
     "llm_structured",
+    "llm_structured_batch_sync",
+    "llm_structured_batch",
+    "llm_structured_stream",
     "llm_tool_call_sync",
     "llm_tool_call",
+    "llm_tool_call_batch_sync",
+    "llm_tool_call_batch",
     "llm_unstructured_sync",
     "llm_unstructured",
+    "llm_unstructured_stream",
     "get_router",
+    "get_routers",
     "Conversation",
+    "LLMResponseCache",
+    "LRUResponseCache",
     "LiteLLMCacheControl",
     "LiteLLMMediaMessagePart",
     "LiteLLMMessage",
@@ -0,0 +1,42 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Protocol
+
+from pydantic_core import to_json
+
+from aikernel._internal.types.provider import LiteLLMMessage
+from aikernel._internal.types.response import LLMUnstructuredResponse
+
+
+class LLMResponseCache(Protocol):
+    def get(self, *, messages: list[LiteLLMMessage], model: str) -> LLMUnstructuredResponse | None: ...
+
+    def set(self, *, messages: list[LiteLLMMessage], model: str, response: LLMUnstructuredResponse) -> None: ...
+
+
+class LRUResponseCache:
+    def __init__(self, *, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._responses: OrderedDict[str, LLMUnstructuredResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, *, messages: list[LiteLLMMessage], model: str) -> LLMUnstructuredResponse | None:
+        key = self._key(messages=messages, model=model)
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+
+        return response
+
+    def set(self, *, messages: list[LiteLLMMessage], model: str, response: LLMUnstructuredResponse) -> None:
+        key = self._key(messages=messages, model=model)
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            if len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+
+    def _key(self, *, messages: list[LiteLLMMessage], model: str) -> str:
+        return hashlib.blake2b(to_json([model, messages]), digest_size=32).hexdigest()
@@ -1,6 +1,11 @@
-import json
+import itertools
+import operator
 from collections.abc import Iterator
 from contextlib import contextmanager
+from typing import TypedDict
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from aikernel._internal.types.request import (
     LLMAssistantMessage,
@@ -11,6 +16,16 @@ from aikernel._internal.types.request import (
 )
 
 
+class _ConversationDump(TypedDict):
+    system: LLMSystemMessage | None
+    user: list[LLMUserMessage]
+    assistant: list[LLMAssistantMessage]
+    tool: list[LLMToolMessage]
+
+
+_conversation_dump_adapter = TypeAdapter(_ConversationDump)
+
+
 class Conversation:
     def __init__(self) -> None:
         self._user_messages: list[LLMUserMessage] = []
@@ -47,9 +62,12 @@ class Conversation:
         self._system_message = message
 
     def render(self) -> list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage]:
-        messages = [self._system_message] if self._system_message is not None else []
+        messages: list[LLMSystemMessage | LLMUserMessage | LLMAssistantMessage | LLMToolMessage] = (
+            [self._system_message] if self._system_message is not None else []
+        )
         messages += sorted(
-            self._user_messages + self._assistant_messages + self._tool_messages, key=lambda message: message.created_at
+            itertools.chain(self._user_messages, self._assistant_messages, self._tool_messages),
+            key=operator.attrgetter("created_at"),
         )
 
         return messages
@@ -72,36 +90,37 @@ class Conversation:
         try:
             yield
         except Exception:
-            self._user_messages = self._user_messages[:num_user_messages]
-            self._assistant_messages = self._assistant_messages[:num_assistant_messages]
-            self._tool_messages = self._tool_messages[:num_tool_messages]
+            del self._user_messages[num_user_messages:]
+            del self._assistant_messages[num_assistant_messages:]
+            del self._tool_messages[num_tool_messages:]
             raise
 
     def dump(self) -> str:
-        conversation_dump = {
-            "system": self._system_message.model_dump() if self._system_message is not None else None,
-            "user": [message.model_dump() for message in self._user_messages],
-            "assistant": [message.model_dump() for message in self._assistant_messages],
-            "tool": [message.model_dump() for message in self._tool_messages],
+        conversation_dump: _ConversationDump = {
+            "system": self._system_message,
+            "user": self._user_messages,
+            "assistant": self._assistant_messages,
+            "tool": self._tool_messages,
         }
 
-        return json.dumps(conversation_dump, default=str)
+        # serialized in a single pydantic-core pass, without intermediate per-message dicts
+        return to_json(conversation_dump, fallback=str).decode()
 
     @classmethod
     def load(cls, *, dump: str) -> "Conversation":
-        conversation_dump = json.loads(dump)
+        conversation_dump = _conversation_dump_adapter.validate_json(dump)
         conversation = cls()
 
         if conversation_dump["system"] is not None:
-            conversation.set_system_message(message=LLMSystemMessage.model_validate(conversation_dump["system"]))
+            conversation.set_system_message(message=conversation_dump["system"])
 
         for user_message in conversation_dump["user"]:
-            conversation.add_user_message(message=LLMUserMessage.model_validate(user_message))
+            conversation.add_user_message(message=user_message)
 
         for assistant_message in conversation_dump["assistant"]:
-            conversation.add_assistant_message(message=LLMAssistantMessage.model_validate(assistant_message))
+            conversation.add_assistant_message(message=assistant_message)
 
         for tool_message in conversation_dump["tool"]:
-            conversation.add_tool_message(tool_message=LLMToolMessage.model_validate(tool_message))
+            conversation.add_tool_message(tool_message=tool_message)
 
         return conversation
@@ -0,0 +1,21 @@
+from aikernel._internal.types.provider import LiteLLMMessage
+from aikernel._internal.types.request import (
+    LLMAssistantMessage,
+    LLMSystemMessage,
+    LLMToolMessage,
+    LLMUserMessage,
+)
+
+
+def render_messages(
+    *, messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]
+) -> list[LiteLLMMessage]:
+    rendered_messages: list[LiteLLMMessage] = []
+    for message in messages:
+        # identity check instead of isinstance: LLMToolMessage is final, so no subclass can slip past
+        if type(message) is LLMToolMessage:
+            rendered_messages.extend(message.render_call_and_response())
+        else:
+            rendered_messages.append(message.render())
+
+    return rendered_messages
@@ -1,10 +1,15 @@
+import asyncio
+import contextlib
 import functools
-from collections.abc import Callable
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
 from enum import StrEnum
-from typing import Any, Literal, NoReturn, NotRequired, TypedDict, cast
+from typing import Any, Literal, NoReturn, NotRequired, Protocol, TypedDict, cast
 
+import litellm
 from litellm import Router
 from litellm.exceptions import BadRequestError, RateLimitError, ServiceUnavailableError
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from pydantic import BaseModel
 
 from aikernel._internal.types.provider import LiteLLMMessage, LiteLLMTool
@@ -23,6 +28,18 @@ class LLMModelName(StrEnum):
     CLAUDE_37_SONNET = "bedrock/us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 
 
+MAX_HTTP_CONNECTIONS = 200
+
+
+async def _close_on_loop_shutdown(client: AsyncHTTPHandler) -> AsyncGenerator[None]:
+    # asyncio.run finalizes pending async generators before closing its loop, so the client is closed while its
+    # connections can still be shut down cleanly
+    try:
+        yield
+    finally:
+        await client.close()
+
+
 def disable_method[**P, R](func: Callable[P, R]) -> Callable[P, NoReturn]:
     @functools.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> NoReturn:
@@ -31,43 +48,66 @@ def disable_method[**P, R](func: Callable[P, R]) -> Callable[P, NoReturn]:
     return wrapper
 
 
-class ModelResponseChoiceToolCallFunction(BaseModel):
-    name: str
-    arguments: str
+class ModelResponseChoiceToolCallFunction(Protocol):
+    @property
+    def name(self) -> str: ...
+    @property
+    def arguments(self) -> str: ...
 
 
-class ModelResponseChoiceToolCall(BaseModel):
-    id: str
-    function: ModelResponseChoiceToolCallFunction
-    type: Literal["function"]
+class ModelResponseChoiceToolCall(Protocol):
+    @property
+    def id(self) -> str: ...
+    @property
+    def function(self) -> ModelResponseChoiceToolCallFunction: ...
 
 
-class ModelResponseChoiceMessage(BaseModel):
-    role: Literal["assistant"]
-    content: str | None
-    tool_calls: list[ModelResponseChoiceToolCall] | None
+class ModelResponseChoiceMessage(Protocol):
+    @property
+    def content(self) -> str | None: ...
+    @property
+    def tool_calls(self) -> Sequence[ModelResponseChoiceToolCall] | None: ...
 
 
-class ModelResponseChoice(BaseModel):
-    finish_reason: Literal["stop", "tool_calls"]
-    index: int
-    message: ModelResponseChoiceMessage
+class ModelResponseChoice(Protocol):
+    @property
+    def message(self) -> ModelResponseChoiceMessage: ...
+
+
+class ModelResponseUsage(Protocol):
+    @property
+    def completion_tokens(self) -> int: ...
+    @property
+    def prompt_tokens(self) -> int: ...
+
+
+class ModelResponse(Protocol):
+    @property
+    def model(self) -> str: ...
+    @property
+    def choices(self) -> Sequence[ModelResponseChoice]: ...
+    @property
+    def usage(self) -> ModelResponseUsage: ...
 
 
-class ModelResponseUsage(BaseModel):
+class ModelResponseStreamUsage(BaseModel):
     completion_tokens: int
     prompt_tokens: int
-    total_tokens: int
 
 
-class ModelResponse(BaseModel):
-    id: str
-    created: int
+class ModelResponseStreamChoiceDelta(BaseModel):
+    content: str | None = None
+
+
+class ModelResponseStreamChoice(BaseModel):
+    index: int
+    delta: ModelResponseStreamChoiceDelta
+
+
+class ModelResponseStreamChunk(BaseModel):
     model: str
-    object: Literal["chat.completion"]
-    system_fingerprint: str | None
-    choices: list[ModelResponseChoice]
-    usage: ModelResponseUsage
+    choices: list[ModelResponseStreamChoice]
+    usage: ModelResponseStreamUsage | None = None
 
 
 class RouterModelLitellmParams(TypedDict):
@@ -86,14 +126,46 @@ class LLMRouter[ModelT: LLMModelName](Router):
     def __init__(self, *, model_list: list[RouterModel[ModelT]], fallbacks: list[dict[ModelT, list[ModelT]]]) -> None:
         super().__init__(model_list=model_list, fallbacks=fallbacks)  # type: ignore
 
-    @property
-    def primary_model(self) -> ModelT:
         model_names = self.model_names
 
         if len(model_names) == 0:
             raise ValueError("No models available")
 
-        return cast(ModelT, model_names[0])
+        self._primary_model = cast(ModelT, model_names[0])
+        self._http_client = HTTPHandler(timeout=litellm.request_timeout, concurrent_limit=MAX_HTTP_CONNECTIONS)
+        self._async_http_clients: dict[asyncio.AbstractEventLoop, tuple[AsyncHTTPHandler, AsyncGenerator[None]]] = {}
+
+    @property
+    def primary_model(self) -> ModelT:
+        return self._primary_model
+
+    async def _get_async_http_client(self) -> AsyncHTTPHandler:
+        # pooled connections are bound to the event loop that opened them, so keep one client per loop
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_http_clients:
+            for closed_loop in [client_loop for client_loop in self._async_http_clients if client_loop.is_closed()]:
+                await self._close_async_http_client(loop=closed_loop)
+
+            client = AsyncHTTPHandler(timeout=litellm.request_timeout, concurrent_limit=MAX_HTTP_CONNECTIONS)
+            lifetime = _close_on_loop_shutdown(client)
+            await anext(lifetime)
+            self._async_http_clients[loop] = (client, lifetime)
+
+        return self._async_http_clients[loop][0]
+
+    async def _close_async_http_client(self, *, loop: asyncio.AbstractEventLoop) -> None:
+        _, lifetime = self._async_http_clients.pop(loop)
+        # a loop closed without finalizing its async generators leaves connections that can no longer be shut down
+        with contextlib.suppress(RuntimeError):
+            await lifetime.aclose()
+
+    def close(self) -> None:
+        self._http_client.close()
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop in self._async_http_clients:
+            await self._close_async_http_client(loop=loop)
 
     def complete(
         self,
@@ -116,6 +188,7 @@ class LLMRouter[ModelT: LLMModelName](Router):
                 max_tokens=max_tokens,
                 temperature=temperature,
                 num_retries=num_retries,
+                client=self._http_client,
             )
         except RateLimitError:
             raise RateLimitExceededError(model_name=self.primary_model)
@@ -124,7 +197,7 @@ class LLMRouter[ModelT: LLMModelName](Router):
         except BadRequestError as error:
             raise LLMRequestError(message=error.message)
 
-        return ModelResponse.model_validate(raw_response, from_attributes=True)
+        return raw_response
 
     async def acomplete(
         self,
@@ -145,13 +218,40 @@ class LLMRouter[ModelT: LLMModelName](Router):
                 tool_choice=tool_choice,
                 temperature=temperature,
                 num_retries=num_retries,
+                client=await self._get_async_http_client(),
             )
         except RateLimitError:
             raise RateLimitExceededError(model_name=self.primary_model)
         except ServiceUnavailableError:
             raise ModelUnavailableError(model_name=self.primary_model)
 
-        return ModelResponse.model_validate(raw_response, from_attributes=True)
+        return raw_response
+
+    async def astream(
+        self,
+        *,
+        messages: list[LiteLLMMessage],
+        response_format: Any | None = None,
+        temperature: float = 1.0,
+        num_retries: int = 0,
+    ) -> AsyncIterator[ModelResponseStreamChunk]:
+        try:
+            raw_stream = await super().acompletion(
+                model=self.primary_model,
+                messages=messages,
+                response_format=response_format,
+                temperature=temperature,
+                num_retries=num_retries,
+                stream=True,
+                stream_options={"include_usage": True},
+                client=await self._get_async_http_client(),
+            )
+            async for raw_chunk in raw_stream:
+                yield ModelResponseStreamChunk.model_validate(raw_chunk, from_attributes=True)
+        except RateLimitError:
+            raise RateLimitExceededError(model_name=self.primary_model)
+        except ServiceUnavailableError:
+            raise ModelUnavailableError(model_name=self.primary_model)
 
     def translate_model_name(self, *, model_name: str) -> LLMModelName:
         table = {model_name.value.split("/")[-1]: model_name for model_name in LLMModelName}
@@ -168,23 +268,34 @@ class LLMRouter[ModelT: LLMModelName](Router):
     def acompletion(self, *args: Any, **kwargs: Any) -> NoReturn: ...
 
 
+def build_fallbacks[ModelT: LLMModelName](*, models: tuple[ModelT, ...]) -> list[dict[ModelT, list[ModelT]]]:
+    return [{model: [other_model for other_model in models if other_model != model]} for model in models]
+
+
 class RouterRegistry:
     def __init__(self) -> None:
         self._routers: dict[tuple[LLMModelName, ...], LLMRouter[LLMModelName]] = {}
+        self._locks: dict[tuple[LLMModelName, ...], threading.Lock] = {}
+        self._locks_lock = threading.Lock()
 
     def get_router[ModelT: LLMModelName](self, *, models: tuple[ModelT, ...]) -> LLMRouter[ModelT]:
         if models in self._routers:
             return self._routers[models]  # type: ignore
 
-        model_list: list[RouterModel[ModelT]] = [
-            {"model_name": model, "litellm_params": {"model": model.value}} for model in models
-        ]
-        fallbacks = [{model: [other_model for other_model in models if other_model != model]} for model in models]
+        # routers may be built concurrently from worker threads (see get_routers); each one registers callbacks in
+        # litellm's global lists, so every models tuple must be built exactly once
+        with self._locks_lock:
+            lock = self._locks.setdefault(models, threading.Lock())
 
-        router = LLMRouter(model_list=model_list, fallbacks=fallbacks)
-        self._routers[models] = router
+        with lock:
+            if models not in self._routers:
+                model_list: list[RouterModel[ModelT]] = [
+                    {"model_name": model, "litellm_params": {"model": model.value}} for model in models
+                ]
+                router = LLMRouter(model_list=model_list, fallbacks=build_fallbacks(models=models))
+                self._routers[models] = router  # type: ignore
 
-        return router
+        return self._routers[models]  # type: ignore
 
 
 router_registry = RouterRegistry()
@@ -192,3 +303,11 @@ router_registry = RouterRegistry()
 
 def get_router[ModelT: LLMModelName](*, models: tuple[ModelT, ...]) -> LLMRouter[ModelT]:
     return router_registry.get_router(models=models)
+
+
+async def get_routers[ModelT: LLMModelName](*, models_groups: list[tuple[ModelT, ...]]) -> list[LLMRouter[ModelT]]:
+    unique_models_groups = list(dict.fromkeys(models_groups))
+    routers = await asyncio.gather(*(asyncio.to_thread(get_router, models=models) for models in unique_models_groups))
+    routers_by_models = dict(zip(unique_models_groups, routers, strict=True))
+
+    return [routers_by_models[models] for models in models_groups]
@@ -1,9 +1,11 @@
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from pydantic import BaseModel
 
+from aikernel._internal.rendering import render_messages
 from aikernel._internal.router import LLMRouter
-from aikernel._internal.types.provider import LiteLLMMessage
 from aikernel._internal.types.request import (
     LLMAssistantMessage,
     LLMSystemMessage,
@@ -23,14 +25,7 @@ def llm_structured_sync[T: BaseModel](
     router: LLMRouter[Any],
     response_model: type[T],
 ) -> LLMStructuredResponse[T]:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
 
     response = router.complete(messages=rendered_messages, response_format=response_model, num_retries=2)
 
@@ -38,7 +33,9 @@ def llm_structured_sync[T: BaseModel](
         raise NoResponseError(model_name=router.primary_model)
 
     text = response.choices[0].message.content or ""
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
 
     response = LLMStructuredResponse(
         text=text, structure=response_model, model=router.translate_model_name(model_name=response.model), usage=usage
@@ -52,14 +49,7 @@ async def llm_structured[T: BaseModel](
     router: LLMRouter[Any],
     response_model: type[T],
 ) -> LLMStructuredResponse[T]:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
 
     response = await router.acomplete(messages=rendered_messages, response_format=response_model, num_retries=2)
 
@@ -67,9 +57,80 @@ async def llm_structured[T: BaseModel](
         raise NoResponseError(model_name=router.primary_model)
 
     text = response.choices[0].message.content or ""
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
 
     response = LLMStructuredResponse(
         text=text, structure=response_model, model=router.translate_model_name(model_name=response.model), usage=usage
     )
     return response
+
+
+async def llm_structured_stream[T: BaseModel](
+    *,
+    messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
+    router: LLMRouter[Any],
+    response_model: type[T],
+) -> AsyncIterator[str | LLMStructuredResponse[T]]:
+    rendered_messages = render_messages(messages=messages)
+
+    text_chunks: list[str] = []
+    model_name: str | None = None
+    usage: LLMResponseUsage | None = None
+    async for chunk in router.astream(messages=rendered_messages, response_format=response_model, num_retries=2):
+        model_name = chunk.model
+        if chunk.usage is not None:
+            usage = LLMResponseUsage.model_construct(
+                input_tokens=chunk.usage.prompt_tokens, output_tokens=chunk.usage.completion_tokens
+            )
+
+        if len(chunk.choices) > 0 and chunk.choices[0].delta.content:
+            text_chunks.append(chunk.choices[0].delta.content)
+            yield chunk.choices[0].delta.content
+
+    if model_name is None:
+        raise NoResponseError(model_name=router.primary_model)
+
+    yield LLMStructuredResponse(
+        text="".join(text_chunks),
+        structure=response_model,
+        model=router.translate_model_name(model_name=model_name),
+        # providers that ignore stream_options send no usage chunk
+        usage=usage or LLMResponseUsage.model_construct(input_tokens=0, output_tokens=0),
+    )
+
+
+async def llm_structured_batch[T: BaseModel](
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[Any],
+    response_model: type[T],
+    max_concurrency: int = 50,
+) -> list[LLMStructuredResponse[T] | BaseException]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(
+        messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
+    ) -> LLMStructuredResponse[T]:
+        async with semaphore:
+            return await llm_structured(messages=messages, router=router, response_model=response_model)
+
+    return await asyncio.gather(*(run(messages) for messages in messages_batch), return_exceptions=True)
+
+
+def llm_structured_batch_sync[T: BaseModel](
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[Any],
+    response_model: type[T],
+    max_concurrency: int = 50,
+) -> list[LLMStructuredResponse[T] | BaseException]:
+    return asyncio.run(
+        llm_structured_batch(
+            messages_batch=messages_batch,
+            router=router,
+            response_model=response_model,
+            max_concurrency=max_concurrency,
+        )
+    )
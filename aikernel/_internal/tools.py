@@ -1,8 +1,10 @@
-import json
-from typing import Any, Literal, overload
+import asyncio
+from typing import Any, Literal, cast, overload
 
+from pydantic_core import from_json
+
+from aikernel._internal.rendering import render_messages
 from aikernel._internal.router import LLMModelName, LLMRouter
-from aikernel._internal.types.provider import LiteLLMMessage
 from aikernel._internal.types.request import (
     LLMAssistantMessage,
     LLMSystemMessage,
@@ -49,16 +51,10 @@ def llm_tool_call_sync(
     tools: list[AnyLLMTool],
     tool_choice: Literal["auto", "required"],
 ) -> LLMAutoToolResponse | LLMRequiredToolResponse:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
 
     rendered_tools = [tool.render() for tool in tools]
+    tools_by_name = {tool.name: tool for tool in tools}
 
     response = router.complete(messages=rendered_messages, tools=rendered_tools, tool_choice=tool_choice)
     used_model = router.translate_model_name(model_name=response.model)
@@ -66,7 +62,9 @@ def llm_tool_call_sync(
     if len(response.choices) == 0:
         raise NoResponseError(model_name=router.primary_model)
 
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
 
     tool_calls = response.choices[0].message.tool_calls or []
     if len(tool_calls) == 0:
@@ -77,18 +75,27 @@ def llm_tool_call_sync(
                 tool_call=None, text=response.choices[0].message.content, model=used_model, usage=usage
             )
 
-    try:
-        chosen_tool = next(tool for tool in tools if tool.name == tool_calls[0].function.name)
-    except (StopIteration, IndexError) as error:
-        raise ToolCallError(model_name=router.primary_model) from error
+    chosen_tool = tools_by_name.get(tool_calls[0].function.name)
+    if chosen_tool is None:
+        raise ToolCallError(model_name=router.primary_model)
 
     try:
-        arguments = json.loads(tool_calls[0].function.arguments)
-    except json.JSONDecodeError as error:
+        arguments = from_json(tool_calls[0].function.arguments)
+    except ValueError as error:
         raise ToolCallError(model_name=router.primary_model) from error
 
-    tool_call = LLMResponseToolCall(id=tool_calls[0].id, tool_name=chosen_tool.name, arguments=arguments)
-    response = LLMAutoToolResponse(tool_call=tool_call, model=used_model, usage=usage)
+    if not isinstance(arguments, dict):
+        raise ToolCallError(model_name=router.primary_model)
+
+    # every field below has already been checked, so validation is skipped
+    tool_call = LLMResponseToolCall.model_construct(
+        id=tool_calls[0].id, tool_name=chosen_tool.name, arguments=cast(dict[str, Any], arguments)
+    )
+
+    if tool_choice == "required":
+        response = LLMRequiredToolResponse.model_construct(tool_call=tool_call, model=used_model, usage=usage)
+    else:
+        response = LLMAutoToolResponse.model_construct(tool_call=tool_call, text=None, model=used_model, usage=usage)
 
     return response
 
@@ -118,16 +125,10 @@ async def llm_tool_call(
     tools: list[AnyLLMTool],
     tool_choice: Literal["auto", "required"] = "auto",
 ) -> LLMAutoToolResponse | LLMRequiredToolResponse:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
 
     rendered_tools = [tool.render() for tool in tools]
+    tools_by_name = {tool.name: tool for tool in tools}
 
     response = await router.acomplete(messages=rendered_messages, tools=rendered_tools, tool_choice=tool_choice)
 
@@ -135,7 +136,9 @@ async def llm_tool_call(
         raise NoResponseError(model_name=router.primary_model)
 
     used_model = router.translate_model_name(model_name=response.model)
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
 
     tool_calls = response.choices[0].message.tool_calls or []
     if len(tool_calls) == 0:
@@ -146,21 +149,104 @@ async def llm_tool_call(
                 tool_call=None, text=response.choices[0].message.content, model=used_model, usage=usage
             )
 
-    try:
-        chosen_tool = next(tool for tool in tools if tool.name == tool_calls[0].function.name)
-    except (StopIteration, IndexError) as error:
-        raise ToolCallError(model_name=used_model) from error
+    chosen_tool = tools_by_name.get(tool_calls[0].function.name)
+    if chosen_tool is None:
+        raise ToolCallError(model_name=used_model)
 
     try:
-        arguments = json.loads(tool_calls[0].function.arguments)
-    except json.JSONDecodeError as error:
+        arguments = from_json(tool_calls[0].function.arguments)
+    except ValueError as error:
         raise ToolCallError(model_name=used_model) from error
 
-    tool_call = LLMResponseToolCall(id=tool_calls[0].id, tool_name=chosen_tool.name, arguments=arguments)
+    if not isinstance(arguments, dict):
+        raise ToolCallError(model_name=used_model)
+
+    # every field below has already been checked, so validation is skipped
+    tool_call = LLMResponseToolCall.model_construct(
+        id=tool_calls[0].id, tool_name=chosen_tool.name, arguments=cast(dict[str, Any], arguments)
+    )
 
     if tool_choice == "required":
-        response = LLMRequiredToolResponse(tool_call=tool_call, model=used_model, usage=usage)
+        response = LLMRequiredToolResponse.model_construct(tool_call=tool_call, model=used_model, usage=usage)
     else:
-        response = LLMAutoToolResponse(tool_call=tool_call, model=used_model, usage=usage)
+        response = LLMAutoToolResponse.model_construct(tool_call=tool_call, text=None, model=used_model, usage=usage)
 
     return response
+
+
+@overload
+async def llm_tool_call_batch(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["auto"],
+    max_concurrency: int = 50,
+) -> list[LLMAutoToolResponse | BaseException]: ...
+@overload
+async def llm_tool_call_batch(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["required"],
+    max_concurrency: int = 50,
+) -> list[LLMRequiredToolResponse | BaseException]: ...
+
+
+async def llm_tool_call_batch(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["auto", "required"] = "auto",
+    max_concurrency: int = 50,
+) -> list[LLMAutoToolResponse | BaseException] | list[LLMRequiredToolResponse | BaseException]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(
+        messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
+    ) -> LLMAutoToolResponse | LLMRequiredToolResponse:
+        async with semaphore:
+            return await llm_tool_call(messages=messages, router=router, tools=tools, tool_choice=tool_choice)
+
+    return await asyncio.gather(*(run(messages) for messages in messages_batch), return_exceptions=True)  # type: ignore
+
+
+@overload
+def llm_tool_call_batch_sync(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["auto"],
+    max_concurrency: int = 50,
+) -> list[LLMAutoToolResponse | BaseException]: ...
+@overload
+def llm_tool_call_batch_sync(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["required"],
+    max_concurrency: int = 50,
+) -> list[LLMRequiredToolResponse | BaseException]: ...
+
+
+def llm_tool_call_batch_sync(
+    *,
+    messages_batch: list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]],
+    router: LLMRouter[LLMModelName],
+    tools: list[AnyLLMTool],
+    tool_choice: Literal["auto", "required"] = "auto",
+    max_concurrency: int = 50,
+) -> list[LLMAutoToolResponse | BaseException] | list[LLMRequiredToolResponse | BaseException]:
+    return asyncio.run(
+        llm_tool_call_batch(
+            messages_batch=messages_batch,
+            router=router,
+            tools=tools,
+            tool_choice=tool_choice,  # type: ignore
+            max_concurrency=max_concurrency,
+        )
+    )
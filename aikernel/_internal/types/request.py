@@ -1,9 +1,14 @@
+import functools
 import json
-from datetime import UTC, datetime
+import re
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
-from typing import Any, Literal, NoReturn, Self
+from typing import Any, Literal, NoReturn, Self, final
 
-from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
+from pydantic_core import from_json, to_json
 
 from aikernel._internal.types.provider import (
     LiteLLMMediaMessagePart,
@@ -12,6 +17,9 @@ from aikernel._internal.types.provider import (
     LiteLLMTool,
 )
 
+FUNCTION_NAME_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
 
 class LLMMessageRole(StrEnum):
     SYSTEM = "system"
@@ -31,22 +39,56 @@ class LLMMessageContentType(StrEnum):
 
 
 class LLMMessagePart(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content: str
     content_type: LLMMessageContentType = LLMMessageContentType.TEXT
 
+    @functools.cached_property
+    def is_text(self) -> bool:
+        return self.content_type == LLMMessageContentType.TEXT
+
+    @functools.cached_property
+    def rendered_image_url(self) -> str:
+        return f"data:{self.content_type};base64,{self.content}"
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # cached properties live in __dict__, which model_copy carries over verbatim
+        for name in ("is_text", "rendered_image_url"):
+            vars(copied).pop(name, None)
+        return copied
+
 
 class _LLMMessage(BaseModel):
     parts: list[LLMMessagePart]
     cache: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: int = Field(default_factory=time.time_ns)  # nanoseconds since the epoch, used for ordering
+
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def created_at_from_datetime(cls, value: Any) -> Any:
+        # conversation dumps written before created_at became an integer hold datetimes
+        if isinstance(value, str) and not value.isdigit():
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=UTC)
+            return (value - EPOCH) // timedelta(microseconds=1) * 1_000
+
+        return value
+
+    @property
+    def created_at_datetime(self) -> datetime:
+        return EPOCH + timedelta(microseconds=self.created_at // 1_000)
 
     def render_parts(self) -> list[LiteLLMMediaMessagePart | LiteLLMTextMessagePart]:
         parts: list[LiteLLMMediaMessagePart | LiteLLMTextMessagePart] = []
         for part in self.parts:
-            if part.content_type == LLMMessageContentType.TEXT:
+            if part.is_text:
                 parts.append({"type": "text", "text": part.content})
             else:
-                parts.append({"type": "image_url", "image_url": f"data:{part.content_type};base64,{part.content}"})
+                parts.append({"type": "image_url", "image_url": part.rendered_image_url})
 
         return parts
 
@@ -90,8 +132,9 @@ class LLMAssistantMessage(_LLMMessage):
 
     @model_validator(mode="after")
     def no_media_parts(self) -> Self:
-        if any(part.content_type != LLMMessageContentType.TEXT for part in self.parts):
-            raise ValueError("Assistant messages can not have media parts")
+        for part in self.parts:
+            if not part.is_text:
+                raise ValueError("Assistant messages can not have media parts")
 
         return self
 
@@ -108,6 +151,7 @@ class LLMToolMessageFunctionCall(BaseModel):
     arguments: dict[str, Any]
 
 
+@final
 class LLMToolMessage(_LLMMessage):
     tool_call_id: str
     name: str
@@ -165,6 +209,12 @@ class LLMToolMessage(_LLMMessage):
         return invocation_message, response_message
 
 
+@functools.cache
+def _tool_parameters_schema_json(parameters: type[BaseModel]) -> bytes:
+    # cached as immutable JSON since providers (e.g. litellm's Gemini transform) edit the schema dict in place
+    return to_json(parameters.model_json_schema())
+
+
 class LLMTool[ParametersT: BaseModel](BaseModel):
     name: str
     description: str
@@ -173,7 +223,7 @@ class LLMTool[ParametersT: BaseModel](BaseModel):
     @field_validator("name", mode="after")
     @classmethod
     def validate_function_name(cls, value: str) -> str:
-        if not value.replace("_", "").isalnum():
+        if FUNCTION_NAME_PATTERN.fullmatch(value) is None:
             raise ValueError("Function name must be alphanumeric plus underscores")
 
         return value
@@ -184,6 +234,6 @@ class LLMTool[ParametersT: BaseModel](BaseModel):
             "function": {
                 "name": self.name,
                 "description": self.description,
-                "parameters": self.parameters.model_json_schema(),
+                "parameters": from_json(_tool_parameters_schema_json(self.parameters)),
             },
         }
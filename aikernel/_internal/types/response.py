@@ -1,18 +1,22 @@
 from typing import Any, Self
 
-from pydantic import BaseModel, ValidationError, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, ValidationError, computed_field, model_validator
 
 from aikernel._internal.router import LLMModelName
 from aikernel.errors import SchemaNotFollowedError
 
 
 class LLMResponseToolCall(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     tool_name: str
     arguments: dict[str, Any]
 
 
 class LLMResponseUsage(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     input_tokens: int
     output_tokens: int
 
@@ -21,6 +25,7 @@ class LLMUnstructuredResponse(BaseModel):
     text: str
     model: LLMModelName
     usage: LLMResponseUsage
+    cached: bool = False
 
 
 class LLMStructuredResponse[T: BaseModel](BaseModel):
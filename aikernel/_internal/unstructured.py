@@ -1,7 +1,9 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
+from aikernel._internal.cache import LLMResponseCache
+from aikernel._internal.rendering import render_messages
 from aikernel._internal.router import LLMRouter
-from aikernel._internal.types.provider import LiteLLMMessage
 from aikernel._internal.types.request import (
     LLMAssistantMessage,
     LLMSystemMessage,
@@ -12,19 +14,25 @@ from aikernel._internal.types.response import LLMResponseUsage, LLMUnstructuredR
 from aikernel.errors import NoResponseError
 
 
+def _from_cache(*, response: LLMUnstructuredResponse) -> LLMUnstructuredResponse:
+    # hand out a copy so callers can't mutate the stored entry, and report no usage since nothing was billed
+    return response.model_copy(
+        update={"usage": LLMResponseUsage.model_construct(input_tokens=0, output_tokens=0), "cached": True}
+    )
+
+
 def llm_unstructured_sync(
     *,
     messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
     router: LLMRouter[Any],
+    cache: LLMResponseCache | None = None,
 ) -> LLMUnstructuredResponse:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
+
+    if cache is not None:
+        cached_response = cache.get(messages=rendered_messages, model=router.primary_model)
+        if cached_response is not None:
+            return _from_cache(response=cached_response)
 
     response = router.complete(messages=rendered_messages)
     used_model = router.translate_model_name(model_name=response.model)
@@ -32,10 +40,19 @@ def llm_unstructured_sync(
     if len(response.choices) == 0:
         raise NoResponseError(model_name=used_model)
 
-    text = response.choices[0].message.content or ""
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    text = response.choices[0].message.content
+    if text is None:
+        raise NoResponseError(model_name=used_model)
+
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
+
+    response = LLMUnstructuredResponse.model_construct(text=text, model=used_model, usage=usage)
+
+    if cache is not None:
+        cache.set(messages=rendered_messages, model=router.primary_model, response=response.model_copy())
 
-    response = LLMUnstructuredResponse(text=text, model=used_model, usage=usage)
     return response
 
 
@@ -43,15 +60,14 @@ async def llm_unstructured(
     *,
     messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
     router: LLMRouter[Any],
+    cache: LLMResponseCache | None = None,
 ) -> LLMUnstructuredResponse:
-    rendered_messages: list[LiteLLMMessage] = []
-    for message in messages:
-        if isinstance(message, LLMToolMessage):
-            invocation_message, response_message = message.render_call_and_response()
-            rendered_messages.append(invocation_message)
-            rendered_messages.append(response_message)
-        else:
-            rendered_messages.append(message.render())
+    rendered_messages = render_messages(messages=messages)
+
+    if cache is not None:
+        cached_response = cache.get(messages=rendered_messages, model=router.primary_model)
+        if cached_response is not None:
+            return _from_cache(response=cached_response)
 
     response = await router.acomplete(messages=rendered_messages)
     used_model = router.translate_model_name(model_name=response.model)
@@ -59,8 +75,52 @@ async def llm_unstructured(
     if len(response.choices) == 0:
         raise NoResponseError(model_name=used_model)
 
-    text = response.choices[0].message.content or ""
-    usage = LLMResponseUsage(input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens)
+    text = response.choices[0].message.content
+    if text is None:
+        raise NoResponseError(model_name=used_model)
+
+    usage = LLMResponseUsage.model_construct(
+        input_tokens=response.usage.prompt_tokens, output_tokens=response.usage.completion_tokens
+    )
+
+    response = LLMUnstructuredResponse.model_construct(text=text, model=used_model, usage=usage)
+
+    if cache is not None:
+        cache.set(messages=rendered_messages, model=router.primary_model, response=response.model_copy())
 
-    response = LLMUnstructuredResponse(text=text, model=used_model, usage=usage)
     return response
+
+
+async def llm_unstructured_stream(
+    *,
+    messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage],
+    router: LLMRouter[Any],
+) -> AsyncIterator[str | LLMUnstructuredResponse]:
+    rendered_messages = render_messages(messages=messages)
+
+    text_chunks: list[str] = []
+    model_name: str | None = None
+    usage: LLMResponseUsage | None = None
+    async for chunk in router.astream(messages=rendered_messages):
+        model_name = chunk.model
+        if chunk.usage is not None:
+            usage = LLMResponseUsage.model_construct(
+                input_tokens=chunk.usage.prompt_tokens, output_tokens=chunk.usage.completion_tokens
+            )
+
+        if len(chunk.choices) > 0 and chunk.choices[0].delta.content:
+            text_chunks.append(chunk.choices[0].delta.content)
+            yield chunk.choices[0].delta.content
+
+    if model_name is None:
+        raise NoResponseError(model_name=router.primary_model)
+
+    used_model = router.translate_model_name(model_name=model_name)
+    if len(text_chunks) == 0:
+        raise NoResponseError(model_name=used_model)
+
+    # providers that ignore stream_options send no usage chunk
+    if usage is None:
+        usage = LLMResponseUsage.model_construct(input_tokens=0, output_tokens=0)
+
+    yield LLMUnstructuredResponse.model_construct(text="".join(text_chunks), model=used_model, usage=usage)
@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from aikernel import LLMModelName
+
+
+@pytest.fixture
+def router(mocker: MockerFixture) -> Mock:
+    model_response = SimpleNamespace(
+        model="gemini-2.0-flash",
+        choices=[SimpleNamespace(message=SimpleNamespace(content="hello"))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+    router = mocker.Mock(primary_model=LLMModelName.GEMINI_20_FLASH)
+    router.complete.return_value = model_response
+    router.acomplete = mocker.AsyncMock(return_value=model_response)
+    router.translate_model_name.return_value = LLMModelName.GEMINI_20_FLASH
+    return router
+
+
+@pytest.fixture
+def stream_router(router: Mock) -> Callable[..., Mock]:
+    def configure(*, deltas: list[str | None], send_usage: bool = True) -> Mock:
+        async def astream(**_: Any) -> AsyncIterator[SimpleNamespace]:
+            for delta in deltas:
+                yield SimpleNamespace(
+                    model="gemini-2.0-flash",
+                    usage=None,
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))],
+                )
+            if send_usage:
+                yield SimpleNamespace(
+                    model="gemini-2.0-flash", usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5), choices=[]
+                )
+
+        router.astream = astream
+        return router
+
+    return configure
+
+
+@pytest.fixture
+def batch_router(router: Mock) -> Callable[..., dict[str, int]]:
+    # answers each request via respond(prompt text); longer prompts finish first, so completion order != input order
+    def configure(respond: Callable[[str], SimpleNamespace]) -> dict[str, int]:
+        concurrency = {"active": 0, "max": 0}
+
+        async def acomplete(*, messages: list[dict[str, Any]], **_: Any) -> SimpleNamespace:
+            text: str = messages[0]["content"][0]["text"]
+            concurrency["active"] += 1
+            concurrency["max"] = max(concurrency["max"], concurrency["active"])
+            await asyncio.sleep(0.01 * (10 - len(text)))
+            concurrency["active"] -= 1
+
+            return respond(text)
+
+        router.acomplete = acomplete
+        return concurrency
+
+    return configure
@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+
+from aikernel import (
+    LLMAssistantMessage,
+    LLMMessagePart,
+    LLMModelName,
+    LLMResponseUsage,
+    LLMSystemMessage,
+    LLMToolMessage,
+    LLMUnstructuredResponse,
+    LLMUserMessage,
+    LRUResponseCache,
+    llm_unstructured,
+    llm_unstructured_sync,
+)
+from aikernel._internal.types.provider import LiteLLMMessage
+
+
+def _messages(text: str) -> list[LiteLLMMessage]:
+    return [{"role": "user", "content": [{"type": "text", "text": text}]}]
+
+
+def _response(text: str) -> LLMUnstructuredResponse:
+    return LLMUnstructuredResponse(
+        text=text, model=LLMModelName.GEMINI_20_FLASH, usage=LLMResponseUsage(input_tokens=10, output_tokens=5)
+    )
+
+
+def test_lru_cache_miss() -> None:
+    cache = LRUResponseCache()
+    cache.set(messages=_messages("a"), model="model", response=_response("a"))
+
+    assert cache.get(messages=_messages("b"), model="model") is None
+    assert cache.get(messages=_messages("a"), model="other-model") is None
+
+
+def test_lru_cache_hit() -> None:
+    cache = LRUResponseCache()
+    response = _response("a")
+    cache.set(messages=_messages("a"), model="model", response=response)
+
+    assert cache.get(messages=_messages("a"), model="model") == response
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache = LRUResponseCache(max_size=2)
+    cache.set(messages=_messages("a"), model="model", response=_response("a"))
+    cache.set(messages=_messages("b"), model="model", response=_response("b"))
+    cache.get(messages=_messages("a"), model="model")
+    cache.set(messages=_messages("c"), model="model", response=_response("c"))
+
+    assert cache.get(messages=_messages("b"), model="model") is None
+    assert cache.get(messages=_messages("a"), model="model") is not None
+    assert cache.get(messages=_messages("c"), model="model") is not None
+
+
+def test_unstructured_sync_cache_hit(router: Mock) -> None:
+    cache = LRUResponseCache()
+    messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage] = [
+        LLMUserMessage(parts=[LLMMessagePart(content="hi")])
+    ]
+
+    first = llm_unstructured_sync(messages=messages, router=router, cache=cache)
+    first.text = "mutated"
+    second = llm_unstructured_sync(messages=messages, router=router, cache=cache)
+
+    router.complete.assert_called_once()
+    assert first.cached is False
+    assert first.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+    assert second.text == "hello"
+    assert second.cached is True
+    assert second.usage == LLMResponseUsage(input_tokens=0, output_tokens=0)
+
+
+async def test_unstructured_cache_hit(router: Mock) -> None:
+    cache = LRUResponseCache()
+    messages: list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage] = [
+        LLMUserMessage(parts=[LLMMessagePart(content="hi")])
+    ]
+
+    first = await llm_unstructured(messages=messages, router=router, cache=cache)
+    second = await llm_unstructured(messages=messages, router=router, cache=cache)
+    second.text = "mutated"
+    third = await llm_unstructured(messages=messages, router=router, cache=cache)
+
+    router.acomplete.assert_awaited_once()
+    assert first.cached is False
+    assert second.cached is True
+    assert third.text == "hello"
+    assert third.usage == LLMResponseUsage(input_tokens=0, output_tokens=0)
@@ -0,0 +1,77 @@
+import json
+from datetime import UTC, datetime
+
+from aikernel import (
+    Conversation,
+    LLMAssistantMessage,
+    LLMMessageContentType,
+    LLMMessagePart,
+    LLMSystemMessage,
+    LLMToolMessage,
+    LLMToolMessageFunctionCall,
+    LLMUserMessage,
+)
+
+
+def test_dump_load_round_trip() -> None:
+    conversation = Conversation()
+    conversation.set_system_message(message=LLMSystemMessage(parts=[LLMMessagePart(content="be brief")], cache=True))
+    conversation.add_user_message(
+        message=LLMUserMessage(
+            parts=[
+                LLMMessagePart(content="what is in this image?"),
+                LLMMessagePart(content="aGVsbG8=", content_type=LLMMessageContentType.PNG),
+            ]
+        )
+    )
+    conversation.add_tool_message(
+        tool_message=LLMToolMessage(
+            tool_call_id="call_1",
+            name="describe_image",
+            response={"description": "a greeting", "tags": ["text", "ascii"]},
+            function_call=LLMToolMessageFunctionCall(name="describe_image", arguments={"detail": "high"}),
+        )
+    )
+    conversation.add_assistant_message(message=LLMAssistantMessage(parts=[LLMMessagePart(content="it says hello")]))
+
+    loaded = Conversation.load(dump=conversation.dump())
+
+    assert loaded.system_message == conversation.system_message
+    assert loaded.user_messages == conversation.user_messages
+    assert loaded.assistant_messages == conversation.assistant_messages
+    assert loaded.tool_messages == conversation.tool_messages
+    assert loaded.render() == conversation.render()
+    assert loaded.dump() == conversation.dump()
+
+
+def test_load_dump_with_datetime_created_at() -> None:
+    # dumps written before created_at became integer nanoseconds hold str(datetime) values
+    dump = json.dumps(
+        {
+            "system": None,
+            "user": [
+                {
+                    "parts": [{"content": "hi", "content_type": "text"}],
+                    "cache": False,
+                    "created_at": "2025-03-01 12:00:00.123456+00:00",
+                    "role": "user",
+                }
+            ],
+            "assistant": [
+                {
+                    "parts": [{"content": "hello", "content_type": "text"}],
+                    "cache": False,
+                    "created_at": "2025-03-01 12:00:01+00:00",
+                    "role": "assistant",
+                }
+            ],
+            "tool": [],
+        }
+    )
+
+    conversation = Conversation.load(dump=dump)
+
+    [user_message] = conversation.user_messages
+    assert user_message.created_at == 1740830400123456000
+    assert user_message.created_at_datetime == datetime(2025, 3, 1, 12, 0, 0, 123456, tzinfo=UTC)
+    assert [message.role for message in conversation.render()] == ["user", "assistant"]
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import litellm
+from pytest_mock import MockerFixture
+
+from aikernel import LLMModelName, LLMRouter, get_routers
+from aikernel._internal.router import RouterRegistry
+
+
+def test_get_router_builds_each_models_tuple_once() -> None:
+    registry = RouterRegistry()
+    num_callbacks = len(litellm.success_callback)
+
+    def get_router(_: int) -> LLMRouter[LLMModelName]:
+        return registry.get_router(models=(LLMModelName.GEMINI_20_FLASH,))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        routers = list(executor.map(get_router, range(8)))
+
+    assert all(router is routers[0] for router in routers)
+    assert len(litellm.success_callback) == num_callbacks + 1
+
+
+async def test_get_routers_deduplicates_models_groups(mocker: MockerFixture) -> None:
+    mocker.patch("aikernel._internal.router.router_registry", RouterRegistry())
+    num_callbacks = len(litellm.success_callback)
+    flash = (LLMModelName.GEMINI_20_FLASH,)
+    flash_with_lite = (LLMModelName.GEMINI_20_FLASH, LLMModelName.GEMINI_20_FLASH_LITE)
+
+    routers = await get_routers(models_groups=[flash, flash_with_lite, flash])
+
+    assert routers[0] is routers[2]
+    assert routers[0] is not routers[1]
+    assert routers[1].model_names == [LLMModelName.GEMINI_20_FLASH, LLMModelName.GEMINI_20_FLASH_LITE]
+    assert len(litellm.success_callback) == num_callbacks + 2
@@ -0,0 +1,119 @@
+from collections.abc import Callable
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from aikernel import (
+    LLMAssistantMessage,
+    LLMMessagePart,
+    LLMModelName,
+    LLMResponseUsage,
+    LLMStructuredResponse,
+    LLMSystemMessage,
+    LLMToolMessage,
+    LLMUserMessage,
+    llm_structured_batch,
+    llm_structured_batch_sync,
+    llm_structured_stream,
+)
+from aikernel.errors import NoResponseError
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+def _messages() -> list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]:
+    return [LLMUserMessage(parts=[LLMMessagePart(content="hi")])]
+
+
+async def test_structured_stream_yields_deltas_then_response(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=['{"answer": ', None, '"hello"}'])
+
+    items = [item async for item in llm_structured_stream(messages=_messages(), router=router, response_model=Answer)]
+
+    assert items[:2] == ['{"answer": ', '"hello"}']
+    response = items[2]
+    assert isinstance(response, LLMStructuredResponse)
+    assert response.structured_response == Answer(answer="hello")
+    assert response.model == LLMModelName.GEMINI_20_FLASH
+    assert response.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+    assert len(items) == 3
+
+
+async def test_structured_stream_without_usage_reports_zero_usage(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=['{"answer": "hello"}'], send_usage=False)
+
+    items = [item async for item in llm_structured_stream(messages=_messages(), router=router, response_model=Answer)]
+
+    response = items[-1]
+    assert isinstance(response, LLMStructuredResponse)
+    assert response.structured_response == Answer(answer="hello")
+    assert response.usage == LLMResponseUsage(input_tokens=0, output_tokens=0)
+
+
+async def test_structured_stream_without_chunks_raises(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=[], send_usage=False)
+
+    with pytest.raises(NoResponseError):
+        async for _ in llm_structured_stream(messages=_messages(), router=router, response_model=Answer):
+            pass
+
+
+def _answer(text: str) -> SimpleNamespace:
+    # a prompt of "fail" gets no choices
+    choices = [] if text == "fail" else [SimpleNamespace(message=SimpleNamespace(content=f'{{"answer": "{text}"}}'))]
+    return SimpleNamespace(
+        model="gemini-2.0-flash", choices=choices, usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5)
+    )
+
+
+def _messages_batch(
+    texts: list[str],
+) -> list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]]:
+    return [[LLMUserMessage(parts=[LLMMessagePart(content=text)])] for text in texts]
+
+
+async def test_structured_batch_keeps_order_and_returns_errors(
+    router: Mock, batch_router: Callable[..., dict[str, int]]
+) -> None:
+    batch_router(_answer)
+
+    results = await llm_structured_batch(
+        messages_batch=_messages_batch(["a", "fail", "abc"]), router=router, response_model=Answer
+    )
+
+    assert isinstance(results[0], LLMStructuredResponse)
+    assert results[0].structured_response == Answer(answer="a")
+    assert isinstance(results[1], NoResponseError)
+    assert isinstance(results[2], LLMStructuredResponse)
+    assert results[2].structured_response == Answer(answer="abc")
+
+
+async def test_structured_batch_caps_concurrency(router: Mock, batch_router: Callable[..., dict[str, int]]) -> None:
+    concurrency = batch_router(_answer)
+
+    results = await llm_structured_batch(
+        messages_batch=_messages_batch(["a", "b", "c", "d", "e", "f"]),
+        router=router,
+        response_model=Answer,
+        max_concurrency=2,
+    )
+
+    assert all(isinstance(result, LLMStructuredResponse) for result in results)
+    assert concurrency["max"] == 2
+
+
+def test_structured_batch_sync(router: Mock, batch_router: Callable[..., dict[str, int]]) -> None:
+    batch_router(_answer)
+
+    results = llm_structured_batch_sync(
+        messages_batch=_messages_batch(["a", "fail", "abc"]), router=router, response_model=Answer
+    )
+
+    assert [
+        result.structured_response.answer if isinstance(result, LLMStructuredResponse) else type(result)
+        for result in results
+    ] == ["a", NoResponseError, "abc"]
@@ -0,0 +1,139 @@
+import json
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from pydantic import BaseModel
+
+from aikernel import (
+    LLMAssistantMessage,
+    LLMAutoToolResponse,
+    LLMMessagePart,
+    LLMRequiredToolResponse,
+    LLMResponseToolCall,
+    LLMResponseUsage,
+    LLMSystemMessage,
+    LLMTool,
+    LLMToolMessage,
+    LLMUserMessage,
+    llm_tool_call,
+    llm_tool_call_batch,
+    llm_tool_call_batch_sync,
+    llm_tool_call_sync,
+)
+from aikernel.errors import NoResponseError, ToolCallError
+
+
+class LookupParameters(BaseModel):
+    query: str
+
+
+LOOKUP_TOOL = LLMTool(name="lookup", description="Look something up", parameters=LookupParameters)
+
+
+def _tool_response(*, arguments: str) -> SimpleNamespace:
+    tool_call = SimpleNamespace(id="call_1", function=SimpleNamespace(name="lookup", arguments=arguments))
+    return SimpleNamespace(
+        model="gemini-2.0-flash",
+        choices=[SimpleNamespace(message=SimpleNamespace(content=None, tool_calls=[tool_call]))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+    )
+
+
+def _messages_batch(
+    texts: list[str],
+) -> list[list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]]:
+    return [[LLMUserMessage(parts=[LLMMessagePart(content=text)])] for text in texts]
+
+
+def _lookup(text: str) -> SimpleNamespace:
+    # calls the tool with the prompt text as the query; a prompt of "fail" gets no choices
+    if text == "fail":
+        return SimpleNamespace(model="gemini-2.0-flash", choices=[], usage=None)
+
+    return _tool_response(arguments=json.dumps({"query": text}))
+
+
+def _queries(results: list[LLMRequiredToolResponse | BaseException]) -> list[Any]:
+    return [
+        result.tool_call.arguments["query"] if isinstance(result, LLMRequiredToolResponse) else type(result)
+        for result in results
+    ]
+
+
+async def test_tool_call_batch_keeps_order_and_returns_errors(
+    router: Mock, batch_router: Callable[..., dict[str, int]]
+) -> None:
+    batch_router(_lookup)
+
+    results = await llm_tool_call_batch(
+        messages_batch=_messages_batch(["a", "fail", "abc"]), router=router, tools=[LOOKUP_TOOL], tool_choice="required"
+    )
+
+    assert _queries(results) == ["a", NoResponseError, "abc"]
+
+
+async def test_tool_call_batch_caps_concurrency(router: Mock, batch_router: Callable[..., dict[str, int]]) -> None:
+    concurrency = batch_router(_lookup)
+
+    results = await llm_tool_call_batch(
+        messages_batch=_messages_batch(["a", "b", "c", "d", "e", "f"]),
+        router=router,
+        tools=[LOOKUP_TOOL],
+        tool_choice="required",
+        max_concurrency=3,
+    )
+
+    assert _queries(results) == ["a", "b", "c", "d", "e", "f"]
+    assert concurrency["max"] == 3
+
+
+def test_tool_call_batch_sync(router: Mock, batch_router: Callable[..., dict[str, int]]) -> None:
+    batch_router(_lookup)
+
+    results = llm_tool_call_batch_sync(
+        messages_batch=_messages_batch(["a", "fail", "abc"]), router=router, tools=[LOOKUP_TOOL], tool_choice="required"
+    )
+
+    assert _queries(results) == ["a", NoResponseError, "abc"]
+
+
+def _messages() -> list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]:
+    return [LLMUserMessage(parts=[LLMMessagePart(content="look up the weather")])]
+
+
+def test_tool_call_sync_required_returns_required_response(router: Mock) -> None:
+    router.complete.return_value = _tool_response(arguments='{"query": "weather"}')
+
+    response = llm_tool_call_sync(messages=_messages(), router=router, tools=[LOOKUP_TOOL], tool_choice="required")
+
+    assert type(response) is LLMRequiredToolResponse
+    assert response.tool_call == LLMResponseToolCall(id="call_1", tool_name="lookup", arguments={"query": "weather"})
+    assert response.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+
+
+def test_tool_call_sync_auto_returns_auto_response(router: Mock) -> None:
+    router.complete.return_value = _tool_response(arguments='{"query": "weather"}')
+
+    response = llm_tool_call_sync(messages=_messages(), router=router, tools=[LOOKUP_TOOL], tool_choice="auto")
+
+    assert type(response) is LLMAutoToolResponse
+    assert response.tool_call == LLMResponseToolCall(id="call_1", tool_name="lookup", arguments={"query": "weather"})
+
+
+@pytest.mark.parametrize("arguments", ['["weather"]', '"weather"', "null", "not json"])
+def test_tool_call_sync_rejects_non_object_arguments(router: Mock, arguments: str) -> None:
+    router.complete.return_value = _tool_response(arguments=arguments)
+
+    with pytest.raises(ToolCallError):
+        llm_tool_call_sync(messages=_messages(), router=router, tools=[LOOKUP_TOOL], tool_choice="required")
+
+
+@pytest.mark.parametrize("arguments", ['["weather"]', "not json"])
+async def test_tool_call_rejects_non_object_arguments(router: Mock, arguments: str) -> None:
+    router.acomplete.return_value = _tool_response(arguments=arguments)
+
+    with pytest.raises(ToolCallError):
+        await llm_tool_call(messages=_messages(), router=router, tools=[LOOKUP_TOOL], tool_choice="required")
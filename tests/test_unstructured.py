@@ -0,0 +1,91 @@
+from collections.abc import Callable
+from unittest.mock import Mock
+
+import pytest
+
+from aikernel import (
+    LLMAssistantMessage,
+    LLMMessagePart,
+    LLMModelName,
+    LLMResponseUsage,
+    LLMSystemMessage,
+    LLMToolMessage,
+    LLMUnstructuredResponse,
+    LLMUserMessage,
+    llm_unstructured,
+    llm_unstructured_stream,
+    llm_unstructured_sync,
+)
+from aikernel.errors import NoResponseError
+
+
+def _messages() -> list[LLMUserMessage | LLMAssistantMessage | LLMSystemMessage | LLMToolMessage]:
+    return [LLMUserMessage(parts=[LLMMessagePart(content="hi")])]
+
+
+def _assert_field_types(response: LLMUnstructuredResponse) -> None:
+    assert type(response.text) is str
+    assert type(response.model) is LLMModelName
+    assert type(response.usage) is LLMResponseUsage
+    assert type(response.usage.input_tokens) is int
+    assert type(response.usage.output_tokens) is int
+    assert LLMUnstructuredResponse.model_validate(response.model_dump()) == response
+
+
+def test_unstructured_sync_field_types(router: Mock) -> None:
+    response = llm_unstructured_sync(messages=_messages(), router=router)
+
+    assert response.text == "hello"
+    assert response.model == LLMModelName.GEMINI_20_FLASH
+    assert response.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+    _assert_field_types(response)
+
+
+async def test_unstructured_field_types(router: Mock) -> None:
+    response = await llm_unstructured(messages=_messages(), router=router)
+
+    assert response.text == "hello"
+    assert response.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+    _assert_field_types(response)
+
+
+async def test_unstructured_stream_yields_deltas_then_response(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=["hel", None, "", "lo"])
+
+    items = [item async for item in llm_unstructured_stream(messages=_messages(), router=router)]
+
+    assert items[:2] == ["hel", "lo"]
+    response = items[2]
+    assert isinstance(response, LLMUnstructuredResponse)
+    assert response.text == "hello"
+    assert response.usage == LLMResponseUsage(input_tokens=10, output_tokens=5)
+    assert len(items) == 3
+    _assert_field_types(response)
+
+
+async def test_unstructured_stream_without_usage_reports_zero_usage(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=["hello"], send_usage=False)
+
+    items = [item async for item in llm_unstructured_stream(messages=_messages(), router=router)]
+
+    assert items[0] == "hello"
+    response = items[1]
+    assert isinstance(response, LLMUnstructuredResponse)
+    assert response.text == "hello"
+    assert response.usage == LLMResponseUsage(input_tokens=0, output_tokens=0)
+
+
+async def test_unstructured_stream_without_content_raises(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=[None, ""])
+
+    with pytest.raises(NoResponseError):
+        async for _ in llm_unstructured_stream(messages=_messages(), router=router):
+            pass
+
+
+async def test_unstructured_stream_without_chunks_raises(stream_router: Callable[..., Mock]) -> None:
+    router = stream_router(deltas=[], send_usage=False)
+
+    with pytest.raises(NoResponseError):
+        async for _ in llm_unstructured_stream(messages=_messages(), router=router):
+            pass